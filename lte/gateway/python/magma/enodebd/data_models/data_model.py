@@ -9,12 +9,42 @@ of patent rights can be found in the PATENTS file in the same directory.
 
 from abc import ABC, abstractmethod
 from collections import namedtuple
-from typing import List, Dict, Any, Callable, Optional
-from magma.enodebd.data_models.data_model_parameters import ParameterName
+from typing import List, Dict, Any, Callable, Optional, Tuple
+from magma.enodebd.data_models.data_model_parameters import ParameterName, \
+    TrParameterType
 
 TrParam = namedtuple('TrParam', ['path', 'is_invasive', 'type', 'is_optional'])
 
 
+def _encode_boolean(value: Any) -> str:
+    # Boolean values have integral representations in spec
+    if value is True:
+        return '1'
+    if value is False:
+        return '0'
+    return str(int(value))
+
+
+def _encode_string(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    return str(value)
+
+
+# Map of TR parameter type to its xsd type, and how its value is encoded
+# in a SetParameterValues request
+_ENCODER_BY_TYPE = {
+    TrParameterType.INT: ('xsd:int', str),
+    TrParameterType.UNSIGNED_INT: ('xsd:unsignedInt', str),
+    TrParameterType.BOOLEAN: ('xsd:boolean', _encode_boolean),
+    TrParameterType.STRING: ('xsd:string', _encode_string),
+}
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
 class DataModel(ABC):
     """
     Class to represent relevant data model parameters.
@@ -145,6 +175,123 @@ class DataModel(ABC):
             return transform_function(magma_value)
         return magma_value
 
+    @classmethod
+    def get_magma_transformer(
+        cls,
+        param_name: ParameterName,
+    ) -> Callable[[Any], Any]:
+        """
+        Returns:
+            The function that transform_for_magma() applies to values of the
+            parameter, so callers transforming many values can skip looking
+            it up each time
+        """
+        return cls._get_magma_transforms().get(param_name, _identity)
+
+    @classmethod
+    def get_enb_transformer(
+        cls,
+        param_name: ParameterName,
+    ) -> Callable[[Any], Any]:
+        """
+        Returns:
+            The function that transform_for_enb() applies to values of the
+            parameter, so callers transforming many values can skip looking
+            it up each time
+        """
+        return cls._get_enb_transforms().get(param_name, _identity)
+
+    @classmethod
+    def get_path_by_name(cls) -> Dict[ParameterName, str]:
+        """
+        Returns:
+            Map of parameter name to its TR parameter path, for all parameters
+            and numbered objects of the data model
+        """
+        return cls._get_param_tables()[0]
+
+    @classmethod
+    def get_type_by_name(cls) -> Dict[ParameterName, str]:
+        """
+        Returns:
+            Map of parameter name to its TR parameter type, for all parameters
+            and numbered objects of the data model
+        """
+        return cls._get_param_tables()[1]
+
+    @classmethod
+    def get_encoders(
+        cls,
+    ) -> Dict[ParameterName, Tuple[str, str, Callable[[Any], str],
+                                   Callable[[Any], Any]]]:
+        """
+        Returns:
+            Map of parameter name to its TR parameter path, its xsd type, the
+            function encoding its eNB value for a SetParameterValues request,
+            and the function that transform_for_enb() applies to its values.
+            Parameters of a type that can't be set are left out.
+        """
+        return cls._get_param_tables()[2]
+
+    @classmethod
+    def _get_param_tables(
+        cls,
+    ) -> Tuple[Dict[ParameterName, str], Dict[ParameterName, str],
+               Dict[ParameterName, Tuple[str, str, Callable[[Any], str],
+                                         Callable[[Any], Any]]]]:
+        """
+        The data model is read-only, so the tables are built on first use and
+        then kept on the data model class.
+        """
+        tables = cls.__dict__.get('_param_tables')
+        if tables is None:
+            all_param_names = cls.get_parameter_names()
+            numbered_param_names = cls.get_numbered_param_names()
+            for obj_name, param_name_list in numbered_param_names.items():
+                all_param_names = all_param_names + [obj_name] \
+                    + param_name_list
+
+            enb_transforms = cls._get_enb_transforms()
+            path_by_name = {}
+            type_by_name = {}
+            encoder_by_name = {}
+            for param_name in all_param_names:
+                param_info = cls.get_parameter(param_name)
+                if param_info is not None:
+                    path_by_name[param_name] = param_info.path
+                    type_by_name[param_name] = param_info.type
+                    if param_info.type in _ENCODER_BY_TYPE:
+                        xsd_type, encode = _ENCODER_BY_TYPE[param_info.type]
+                        to_enb = enb_transforms.get(param_name, _identity)
+                        encoder_by_name[param_name] = \
+                            (param_info.path, xsd_type, encode, to_enb)
+            tables = (path_by_name, type_by_name, encoder_by_name)
+            cls._param_tables = tables
+        return tables
+
+    @classmethod
+    def get_plmn_param_paths(
+        cls,
+    ) -> List[Tuple[ParameterName, List[Tuple[ParameterName, str]]]]:
+        """
+        Returns:
+            For each PLMN object in order of its number, the object name and
+            the name and TR parameter path of each parameter belonging to it
+        """
+        plmn_param_paths = cls.__dict__.get('_plmn_param_paths')
+        if plmn_param_paths is None:
+            obj_to_params = cls.get_numbered_param_names()
+            plmn_param_paths = []
+            i = 1
+            while ParameterName.PLMN_N % i in obj_to_params:
+                obj_name = ParameterName.PLMN_N % i
+                name_and_paths = [(name, cls.get_parameter(name).path)
+                                  for name in obj_to_params[obj_name]]
+                plmn_param_paths.append((obj_name, name_and_paths))
+                i += 1
+            cls._plmn_param_paths = plmn_param_paths
+        return plmn_param_paths
+
     @classmethod
     def get_parameter_name_from_path(
         cls,
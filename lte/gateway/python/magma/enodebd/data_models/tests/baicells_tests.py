@@ -12,7 +12,8 @@ of patent rights can be found in the PATENTS file in the same directory.
 from unittest import TestCase
 from lte.gateway.python.magma.enodebd.devices.baicells import \
     BaicellsTrDataModel
-from magma.enodebd.data_models.data_model_parameters import ParameterName
+from magma.enodebd.data_models.data_model_parameters import ParameterName, \
+    TrParameterType
 
 
 class BaicellsTrDataModelTest(TestCase):
@@ -34,6 +35,60 @@ class BaicellsTrDataModelTest(TestCase):
             'Path for parameter %s has incorrect value' %
             ParameterName.GPS_STATUS)
 
+    def test_get_path_by_name(self):
+        path_by_name = BaicellsTrDataModel.get_path_by_name()
+        for name in (ParameterName.GPS_STATUS, ParameterName.PLMN_N % 1,
+                     ParameterName.PLMN_N_PLMNID % 6):
+            self.assertEqual(
+                path_by_name[name],
+                BaicellsTrDataModel.get_parameter(name).path,
+                'Path for parameter %s has incorrect value' % name)
+        self.assertNotIn(ParameterName.DEVICE, path_by_name,
+                         'Should not have %s in path map' %
+                         ParameterName.DEVICE)
+
+    def test_get_type_by_name(self):
+        type_by_name = BaicellsTrDataModel.get_type_by_name()
+        self.assertEqual(type_by_name[ParameterName.EARFCNDL],
+                         TrParameterType.INT,
+                         'Type for parameter %s has incorrect value' %
+                         ParameterName.EARFCNDL)
+
+    def test_get_encoders(self):
+        encoders = BaicellsTrDataModel.get_encoders()
+        path, xsd_type, encode, _to_enb = encoders[ParameterName.ADMIN_STATE]
+        self.assertEqual(path,
+                         BaicellsTrDataModel.get_parameter(
+                             ParameterName.ADMIN_STATE).path,
+                         'Encoder for parameter %s has incorrect path' %
+                         ParameterName.ADMIN_STATE)
+        self.assertEqual(xsd_type, 'xsd:boolean',
+                         'Encoder for parameter %s has incorrect type' %
+                         ParameterName.ADMIN_STATE)
+        self.assertEqual(encode(True), '1',
+                         'Encoder for parameter %s has incorrect value' %
+                         ParameterName.ADMIN_STATE)
+        self.assertEqual(encode('0'), '0',
+                         'Encoder for parameter %s has incorrect value' %
+                         ParameterName.ADMIN_STATE)
+        path, xsd_type, encode, to_enb = encoders[ParameterName.EARFCNDL]
+        self.assertEqual(path,
+                         BaicellsTrDataModel.get_parameter(
+                             ParameterName.EARFCNDL).path,
+                         'Encoder for parameter %s has incorrect path' %
+                         ParameterName.EARFCNDL)
+        self.assertEqual(xsd_type, 'xsd:int',
+                         'Encoder for parameter %s has incorrect type' %
+                         ParameterName.EARFCNDL)
+        self.assertEqual(encode(39150), '39150',
+                         'Encoder for parameter %s has incorrect value' %
+                         ParameterName.EARFCNDL)
+        self.assertEqual(to_enb(39150), 39150,
+                         'Transform for enb should not change value')
+        to_enb = encoders[ParameterName.DL_BANDWIDTH][3]
+        self.assertEqual(to_enb(15), 'n75',
+                         'Transform for enb returning incorrect value')
+
     def test_get_num_plmns(self):
         n_plmns = BaicellsTrDataModel.get_num_plmns()
         expected_n_plmns = 6
@@ -85,6 +140,21 @@ class BaicellsTrDataModelTest(TestCase):
                       'Should have %s in parameter name list' %
                       ParameterName.PLMN_N % 6)
 
+    def test_get_plmn_param_paths(self):
+        plmn_param_paths = BaicellsTrDataModel.get_plmn_param_paths()
+        self.assertEqual(len(plmn_param_paths),
+                         BaicellsTrDataModel.get_num_plmns(),
+                         'Incorrect # of PLMNs')
+        obj_name, name_and_paths = plmn_param_paths[5]
+        self.assertEqual(obj_name, ParameterName.PLMN_N % 6,
+                         'PLMN objects should be in order of their number')
+        self.assertIn((ParameterName.PLMN_N_PLMNID % 6,
+                       BaicellsTrDataModel.get_parameter(
+                           ParameterName.PLMN_N_PLMNID % 6).path),
+                      name_and_paths,
+                      'Should have %s in PLMN parameter paths' %
+                      ParameterName.PLMN_N_PLMNID % 6)
+
     def test_transform_for_magma(self):
         gps_lat = str(10 * 1000000)
         gps_lat_magma = BaicellsTrDataModel.transform_for_magma(
@@ -99,3 +169,19 @@ class BaicellsTrDataModelTest(TestCase):
         expected = 'n75'
         self.assertEqual(dl_bandwidth_enb, expected,
                          'Transform for enb returning incorrect value')
+
+    def test_get_transformers(self):
+        to_enb = BaicellsTrDataModel.get_enb_transformer(
+            ParameterName.DL_BANDWIDTH)
+        self.assertEqual(to_enb(15), 'n75',
+                         'Transform for enb returning incorrect value')
+        to_magma = BaicellsTrDataModel.get_magma_transformer(
+            ParameterName.GPS_LAT)
+        self.assertEqual(to_magma(str(10 * 1000000)), str(10.0),
+                         'Transform for magma returning incorrect value')
+
+        # Parameters without a transform keep their value
+        to_enb = BaicellsTrDataModel.get_enb_transformer(
+            ParameterName.EARFCNDL)
+        self.assertEqual(to_enb(39150), 39150,
+                         'Transform for enb should not change value')
@@ -8,7 +8,7 @@ of patent rights can be found in the PATENTS file in the same directory.
 """
 
 import logging
-from typing import List, Any
+from typing import List, Any, Dict
 from magma.enodebd.data_models.data_model_parameters import ParameterName
 from magma.enodebd.exceptions import ConfigurationError
 from magma.enodebd.data_models.data_model import DataModel
@@ -83,6 +83,19 @@ class EnodebConfiguration():
         self._assert_param_in_model(param_name)
         self._param_to_value[param_name] = value
 
+    def set_parameters(
+        self,
+        param_to_value: Dict[ParameterName, Any],
+    ) -> None:
+        """
+        Args:
+            param_to_value: map of parameter name to the value to set,
+                formatted to be understood by enodebd
+        """
+        for param_name in param_to_value:
+            self._assert_param_in_model(param_name)
+        self._param_to_value.update(param_to_value)
+
     def get_object_names(self) -> List[ParameterName]:
         return list(self._numbered_objects.keys())
 
@@ -128,6 +141,22 @@ class EnodebConfiguration():
         self._assert_param_in_model(param_name)
         self._numbered_objects[object_name][param_name] = value
 
+    def set_parameters_for_object(
+        self,
+        object_name: ParameterName,
+        param_to_value: Dict[ParameterName, Any],
+    ) -> None:
+        """
+        Args:
+            object_name: ParameterName of object
+            param_to_value: map of parameter name to the value to set,
+                formatted to be understood by enodebd
+        """
+        self._assert_param_in_model(object_name)
+        for param_name in param_to_value:
+            self._assert_param_in_model(param_name)
+        self._numbered_objects[object_name].update(param_to_value)
+
     def get_parameter_names_for_object(
         self,
         object_name: ParameterName,
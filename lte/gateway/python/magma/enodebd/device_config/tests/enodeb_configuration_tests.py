@@ -38,6 +38,17 @@ class EnodebConfigurationTest(TestCase):
         self.assertEqual(param_value, expected,
                          'Parameter value does not match what was set')
 
+    def test_set_parameters(self) -> None:
+        self.config.set_parameters({
+            ParameterName.ADMIN_STATE: True,
+            ParameterName.EARFCNDL: 39150,
+        })
+        names_list = self.config.get_parameter_names()
+        self.assertEqual(len(names_list), 2, 'Expected 2 names')
+        param_value = self.config.get_parameter(ParameterName.EARFCNDL)
+        self.assertEqual(param_value, 39150,
+                         'Parameter value does not match what was set')
+
     def test_add_has_delete_object(self) -> None:
         object_name = ParameterName.PLMN_N % 1
         self.assertFalse(self.config.has_object(object_name))
@@ -95,3 +106,17 @@ class EnodebConfigurationTest(TestCase):
         param_list = self.config.get_parameter_names_for_object(
             ParameterName.PLMN_N % 1)
         self.assertEqual(len(param_list), 1, 'Should not be an empty list')
+
+    def test_set_parameters_for_object(self) -> None:
+        object_name = ParameterName.PLMN_N % 1
+        self.config.add_object(object_name)
+        self.config.set_parameters_for_object(object_name, {
+            ParameterName.PLMN_N_CELL_RESERVED % 1: True,
+            ParameterName.PLMN_N_PLMNID % 1: '00101',
+        })
+        param_list = self.config.get_parameter_names_for_object(object_name)
+        self.assertEqual(len(param_list), 2, 'Expected 2 params for object')
+        param_value = self.config.get_parameter_for_object(
+            ParameterName.PLMN_N_PLMNID % 1, object_name)
+        self.assertEqual(param_value, '00101',
+                         'Parameter value does not match what was set')
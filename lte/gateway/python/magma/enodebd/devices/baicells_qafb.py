@@ -125,6 +125,13 @@ class BaicellsQafbWaitGetTransientParametersState(EnodebAcsState):
     Periodically read eNodeB status. Note: keep frequency low to avoid
     backing up large numbers of read operations if enodebd is busy
     """
+    __slots__ = (
+        'done_transition', 'get_obj_params_transition', 'rm_obj_transition',
+        'add_obj_transition', 'set_transition', 'skip_transition',
+    )
+
+    EXPECTED_MSG_TYPES = (models.GetParameterValuesResponse,)
+
     def __init__(
             self,
             acs: EnodebAcsStateMachine,
@@ -151,7 +158,7 @@ class BaicellsQafbWaitGetTransientParametersState(EnodebAcsState):
         # Current values of the fetched parameters
         name_to_val = parse_get_parameter_values_response(self.acs.data_model,
                                                           message)
-        logging.debug('Received Parameters: %s', str(name_to_val))
+        logging.debug('Received Parameters: %s', name_to_val)
 
         # Clear stats when eNodeB stops radiating. This is
         # because eNodeB stops sending performance metrics at this point.
@@ -164,10 +171,11 @@ class BaicellsQafbWaitGetTransientParametersState(EnodebAcsState):
             self.acs.stats_manager.clear_stats()
 
         # Update device configuration
-        for name in name_to_val:
-            magma_value = \
-                self.acs.data_model.transform_for_magma(name, name_to_val[name])
-            self.acs.device_cfg.set_parameter(name, magma_value)
+        to_magma = self.acs.data_model.transform_for_magma
+        self.acs.device_cfg.set_parameters({
+            name: to_magma(name, val)
+            for name, val in name_to_val.items()
+        })
 
         # Update status metrics
         status = get_enodeb_status(self.acs)
@@ -208,6 +216,13 @@ class BaicellsQafbGetObjectParametersState(EnodebAcsState):
     in the data model, rather than replying with a Fault message like most
     eNB devices.
     """
+    __slots__ = (
+        'rm_obj_transition', 'add_obj_transition', 'set_params_transition',
+        'skip_transition',
+    )
+
+    EXPECTED_MSG_TYPES = (models.GetParameterValuesResponse,)
+
     def __init__(
             self,
             acs: EnodebAcsStateMachine,
@@ -233,10 +248,8 @@ class BaicellsQafbGetObjectParametersState(EnodebAcsState):
         request.ParameterNames = models.ParameterNames()
         request.ParameterNames.arrayType = 'xsd:string[%d]' \
                                            % len(names)
-        request.ParameterNames.string = []
-        for name in names:
-            path = self.acs.data_model.get_parameter(name).path
-            request.ParameterNames.string.append(path)
+        path_by_name = self.acs.data_model.get_path_by_name()
+        request.ParameterNames.string = [path_by_name[name] for name in names]
 
         return AcsMsgAndTransition(request, None)
 
@@ -253,20 +266,17 @@ class BaicellsQafbGetObjectParametersState(EnodebAcsState):
         if not isinstance(message, models.GetParameterValuesResponse):
             return AcsReadMsgResult(False, None)
 
-        path_to_val = {}
-        for param_value_struct in message.ParameterList.ParameterValueStruct:
-            path_to_val[param_value_struct.Name] = \
-                param_value_struct.Value.Data
+        path_to_val = {
+            param_value.Name: param_value.Value.Data
+            for param_value in message.ParameterList.ParameterValueStruct
+        }
 
-        logging.debug('Received object parameters: %s', str(path_to_val))
+        logging.debug('Received object parameters: %s', path_to_val)
 
         num_plmns = self.acs.data_model.get_num_plmns()
-        for i in range(1, num_plmns + 1):
-            obj_name = ParameterName.PLMN_N % i
-            obj_to_params = self.acs.data_model.get_numbered_param_names()
-            param_name_list = obj_to_params[obj_name]
-            for name in param_name_list:
-                path = self.acs.data_model.get_parameter(name).path
+        plmn_param_paths = self.acs.data_model.get_plmn_param_paths()
+        for obj_name, name_and_paths in plmn_param_paths[:num_plmns]:
+            for name, path in name_and_paths:
                 if path in path_to_val:
                     value = path_to_val[path]
                     if value is None:
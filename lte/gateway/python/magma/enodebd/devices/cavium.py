@@ -96,6 +96,10 @@ class CaviumDisableAdminEnableState(EnodebAcsState):
     Cavium requires that we disable 'Admin Enable' before configuring
     most parameters
     """
+    __slots__ = ('done_transition',)
+
+    EXPECTED_MSG_TYPES = (models.DummyInput,)
+
     def __init__(self, acs: EnodebAcsStateMachine, when_done: str):
         super().__init__()
         self.acs = acs
@@ -136,24 +140,40 @@ class CaviumDisableAdminEnableState(EnodebAcsState):
 
 
 class CaviumWaitDisableAdminEnableState(EnodebAcsState):
+    __slots__ = ('done_transition', '_handlers')
+
+    EXPECTED_MSG_TYPES = (models.Fault, models.SetParameterValuesResponse)
+
     def __init__(self, acs: EnodebAcsStateMachine, when_done: str):
         super().__init__()
         self.acs = acs
         self.done_transition = when_done
+        self._handlers = {
+            models.Fault: self._handle_fault,
+            models.SetParameterValuesResponse: self._handle_response,
+        }
 
-    def read_msg(self, message: Any) -> Optional[str]:
-        if type(message) == models.Fault:
-            logging.error('Received Fault in response to SetParameterValues')
-            if message.SetParameterValuesFault is not None:
-                for fault in message.SetParameterValuesFault:
-                    logging.error(
-                        'SetParameterValuesFault Param: %s, Code: %s, String: %s',
-                        fault.ParameterName, fault.FaultCode, fault.FaultString)
-            raise Tr069Error(
-                'Received Fault in response to SetParameterValues '
-                '(faultstring = %s)' % message.FaultString)
-        elif not isinstance(message, models.SetParameterValuesResponse):
+    def read_msg(self, message: Any) -> AcsReadMsgResult:
+        handler = self._handlers.get(type(message))
+        if handler is None:
             return AcsReadMsgResult(False, None)
+        return handler(message)
+
+    def _handle_fault(self, message: models.Fault) -> AcsReadMsgResult:
+        logging.error('Received Fault in response to SetParameterValues')
+        if message.SetParameterValuesFault is not None:
+            for fault in message.SetParameterValuesFault:
+                logging.error(
+                    'SetParameterValuesFault Param: %s, Code: %s, String: %s',
+                    fault.ParameterName, fault.FaultCode, fault.FaultString)
+        raise Tr069Error(
+            'Received Fault in response to SetParameterValues '
+            '(faultstring = %s)' % message.FaultString)
+
+    def _handle_response(
+        self,
+        message: models.SetParameterValuesResponse,
+    ) -> AcsReadMsgResult:
         if message.Status != 0:
             raise Tr069Error('Received SetParameterValuesResponse with '
                              'Status=%d' % message.Status)
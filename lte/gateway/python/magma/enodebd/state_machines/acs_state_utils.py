@@ -8,7 +8,7 @@ of patent rights can be found in the PATENTS file in the same directory.
 """
 
 import logging
-from typing import Any, Optional, Dict, List
+from typing import Any, Optional, Dict, Iterator, List
 from magma.enodebd.data_models.data_model import DataModel
 from magma.enodebd.data_models.data_model_parameters import ParameterName
 from magma.enodebd.device_config.enodeb_configuration import \
@@ -51,11 +51,13 @@ def process_inform_message(
     if hasattr(inform, 'ParameterList') and \
             hasattr(inform.ParameterList, 'ParameterValueStruct'):
         param_values_by_path = {}
+        is_debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
         for param_value in inform.ParameterList.ParameterValueStruct:
             path = param_value.Name
             value = param_value.Value.Data
-            logging.debug('(Inform msg) Received parameter: %s = %s', path,
-                          value)
+            if is_debug_enabled:
+                logging.debug('(Inform msg) Received parameter: %s = %s',
+                              path, value)
             param_values_by_path[path] = value
 
         # Check the OUI and version number to see if the data model matches
@@ -77,15 +79,14 @@ def process_inform_message(
                 device_name=correct_device_name)
 
         param_name_list = data_model.get_parameter_names()
+        path_by_name = data_model.get_path_by_name()
         name_to_val = {}
         for name in param_name_list:
-            path = data_model.get_parameter(name).path
+            path = path_by_name[name]
             if path in param_values_by_path:
-                value = param_values_by_path[path]
-                name_to_val[name] = value
+                name_to_val[name] = param_values_by_path[path]
 
-        for name, val in name_to_val.items():
-            device_cfg.set_parameter(name, val)
+        device_cfg.set_parameters(name_to_val)
 
 
 def are_tr069_params_equal(param_a: Any, param_b: Any, type_: str) -> bool:
@@ -134,6 +135,30 @@ def get_all_objects_to_delete(
     return list(set(current).difference(set(desired)))
 
 
+def has_objects_to_add(
+    desired_cfg: EnodebConfiguration,
+    device_cfg: EnodebConfiguration,
+) -> bool:
+    """
+    True if there is a ParameterName that needs to be added to the eNB
+    configuration. Stops at the first one found.
+    """
+    current = set(device_cfg.get_object_names())
+    return any(name not in current for name in desired_cfg.get_object_names())
+
+
+def has_objects_to_delete(
+    desired_cfg: EnodebConfiguration,
+    device_cfg: EnodebConfiguration,
+) -> bool:
+    """
+    True if there is a ParameterName that needs to be deleted from the eNB
+    configuration. Stops at the first one found.
+    """
+    desired = set(desired_cfg.get_object_names())
+    return any(name not in desired for name in device_cfg.get_object_names())
+
+
 def get_params_to_get(
     device_cfg: EnodebConfiguration,
     data_model: DataModel,
@@ -156,22 +181,62 @@ def get_object_params_to_get(
     Returns a list of parameter names for object parameters we don't know the
     current value of
     """
-    names = []
+    return list(_iter_object_params_to_get(desired_cfg, device_cfg,
+                                           data_model))
+
+
+def has_params_to_get(
+    device_cfg: EnodebConfiguration,
+    data_model: DataModel,
+) -> bool:
+    """
+    True if there are params not belonging to objects that are added/removed,
+    which we don't know the current value of. Stops at the first one found.
+    """
+    return any(not device_cfg.has_parameter(name)
+               for name in data_model.get_present_params())
+
+
+def has_object_params_to_get(
+    desired_cfg: Optional[EnodebConfiguration],
+    device_cfg: EnodebConfiguration,
+    data_model: DataModel,
+) -> bool:
+    """
+    True if there are object parameters we don't know the current value of.
+    Stops at the first one found.
+    """
+    return any(True for _ in _iter_object_params_to_get(desired_cfg,
+                                                        device_cfg,
+                                                        data_model))
+
+
+def _iter_object_params_to_get(
+    desired_cfg: Optional[EnodebConfiguration],
+    device_cfg: EnodebConfiguration,
+    data_model: DataModel,
+) -> Iterator[ParameterName]:
+    """
+    Yields the names of object parameters we don't know the current value of.
+
+    Before yielding anything, this adds all the PLMN objects missing from the
+    device configuration.
+    """
     # TODO: This might a string for some strange reason, investigate why
     num_plmns = \
         int(device_cfg.get_parameter(ParameterName.NUM_PLMNS))
-    for i in range(1, num_plmns + 1):
-        obj_name = ParameterName.PLMN_N % i
+    obj_names = [ParameterName.PLMN_N % i for i in range(1, num_plmns + 1)]
+    for obj_name in obj_names:
         if not device_cfg.has_object(obj_name):
             device_cfg.add_object(obj_name)
-        obj_to_params = data_model.get_numbered_param_names()
-        desired = obj_to_params[obj_name]
-        current = []
+    obj_to_params = data_model.get_numbered_param_names()
+    for obj_name in obj_names:
+        current = set()
         if desired_cfg is not None:
-            current = desired_cfg.get_parameter_names_for_object(obj_name)
-        names_to_add = list(set(desired) - set(current))
-        names = names + names_to_add
-    return names
+            current = set(desired_cfg.get_parameter_names_for_object(obj_name))
+        for name in obj_to_params[obj_name]:
+            if name not in current:
+                yield name
 
 
 # We don't attempt to set these parameters on the eNB configuration
@@ -206,10 +271,11 @@ def get_param_values_to_set(
     if exclude_admin:
         params = set(params) - {ParameterName.ADMIN_STATE}
     # Values of parameters
+    type_by_name = data_model.get_type_by_name()
     for name in params:
         new = desired_cfg.get_parameter(name)
         old = device_cfg.get_parameter(name)
-        _type = data_model.get_parameter(name).type
+        _type = type_by_name[name]
         if not are_tr069_params_equal(new, old, _type):
             param_values[name] = new
 
@@ -223,6 +289,7 @@ def get_obj_param_values_to_set(
 ) -> Dict[ParameterName, Dict[ParameterName, Any]]:
     """ Returns a map from object name to (a map of param name to value) """
     param_values = {}
+    type_by_name = data_model.get_type_by_name()
     objs = desired_cfg.get_object_names()
     for obj_name in objs:
         param_values[obj_name] = {}
@@ -230,7 +297,7 @@ def get_obj_param_values_to_set(
         for name in params:
             new = desired_cfg.get_parameter_for_object(name, obj_name)
             old = device_cfg.get_parameter_for_object(name, obj_name)
-            _type = data_model.get_parameter(name).type
+            _type = type_by_name[name]
             if not are_tr069_params_equal(new, old, _type):
                 param_values[obj_name][name] = new
     return param_values
@@ -258,33 +325,33 @@ def parse_get_parameter_values_response(
     message: models.GetParameterValuesResponse,
 ) -> Dict[ParameterName, Any]:
     """ Returns a map of ParameterName to the value read from the response """
-    param_values_by_path = {}
-    for param_value_struct in message.ParameterList.ParameterValueStruct:
-        param_values_by_path[param_value_struct.Name] = \
-            param_value_struct.Value.Data
+    param_values_by_path = {
+        param_value.Name: param_value.Value.Data
+        for param_value in message.ParameterList.ParameterValueStruct
+    }
 
     param_name_list = data_model.get_parameter_names()
+    path_by_name = data_model.get_path_by_name()
     name_to_val = {}
     for name in param_name_list:
-        path = data_model.get_parameter(name).path
+        path = path_by_name[name]
         if path in param_values_by_path:
-            value = param_values_by_path[path]
-            name_to_val[name] = value
+            name_to_val[name] = param_values_by_path[path]
 
     return name_to_val
 
 
-def get_optional_param_to_check(
+def get_all_optional_params_to_check(
     data_model: DataModel,
-) -> Optional[ParameterName]:
+) -> List[ParameterName]:
     """
-    If there is a parameter which is optional in the data model, and we do not
-    know if it exists or not, then return it so we can check for its presence.
+    Return all parameters which are optional in the data model, and for which
+    we do not know if they exist or not, so we can check for their presence.
     """
-    params = data_model.get_names_of_optional_params()
-    for param in params:
+    params_to_check = []
+    for param in data_model.get_names_of_optional_params():
         try:
             data_model.is_parameter_present(param)
         except KeyError:
-            return param
-    return None
+            params_to_check.append(param)
+    return params_to_check
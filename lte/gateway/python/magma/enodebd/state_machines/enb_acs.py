@@ -64,11 +64,12 @@ class EnodebAcsStateMachine(ABC):
         if not self.data_model.are_param_presences_known():
             return False
         desired = self.desired_cfg.get_parameter_names()
+        type_by_name = self.data_model.get_type_by_name()
 
         for name in desired:
             val1 = self.desired_cfg.get_parameter(name)
             val2 = self.device_cfg.get_parameter(name)
-            type_ = self.data_model.get_parameter(name).type
+            type_ = type_by_name[name]
             if not are_tr069_params_equal(val1, val2, type_):
                 return False
 
@@ -78,7 +79,7 @@ class EnodebAcsStateMachine(ABC):
                 val1 = self.device_cfg.get_parameter_for_object(name, obj_name)
                 val2 = self.desired_cfg.get_parameter_for_object(name,
                                                                  obj_name)
-                type_ = self.data_model.get_parameter(name).type
+                type_ = type_by_name[name]
                 if not are_tr069_params_equal(val1, val2, type_):
                     return False
         return True
@@ -17,7 +17,8 @@ from magma.enodebd.device_config.enodeb_configuration import \
 from magma.enodebd.enodeb_status import get_enodeb_status
 from magma.enodebd.exceptions import ConfigurationError
 from magma.enodebd.state_machines.enb_acs import EnodebAcsStateMachine
-from magma.enodebd.state_machines.enb_acs_states import EnodebAcsState
+from magma.enodebd.state_machines.enb_acs_states import AcsReadMsgResult, \
+    EnodebAcsState
 from magma.enodebd.state_machines.timer import StateMachineTimer
 from magma.enodebd.stats_manager import StatsManager
 from magma.enodebd.tr069 import models
@@ -110,13 +111,22 @@ class BasicEnodebAcsStateMachine(EnodebAcsStateMachine):
     def _read_tr069_msg(self, message: Any) -> None:
         """ Process incoming message and maybe transition state """
         self._reset_timeout()
-        msg_handled, next_state = self.state.read_msg(message)
+        msg_handled, next_state = self._state_read_msg(message)
         if not msg_handled:
             self._transition_for_unexpected_msg(message)
-            _msg_handled, next_state = self.state.read_msg(message)
+            _msg_handled, next_state = self._state_read_msg(message)
         if next_state is not None:
             self.transition(next_state)
 
+    def _state_read_msg(self, message: Any) -> AcsReadMsgResult:
+        """
+        Have the current state read the message, skipping the call entirely
+        if the state does not expect messages of this type
+        """
+        if not isinstance(message, self.state.EXPECTED_MSG_TYPES):
+            return AcsReadMsgResult(False, None)
+        return self.state.read_msg(message)
+
     def _get_tr069_msg(self) -> Any:
         """ Get a new message to send, and maybe transition state """
         msg_and_transition = self.state.get_msg()
@@ -8,8 +8,10 @@ of patent rights can be found in the PATENTS file in the same directory.
 """
 
 import logging
-from collections import namedtuple
-from typing import Any
+from collections import deque, namedtuple
+from functools import lru_cache
+from weakref import WeakKeyDictionary
+from typing import Any, Dict, Tuple
 from abc import ABC, abstractmethod
 from magma.enodebd.data_models.data_model_parameters import ParameterName
 from magma.enodebd.device_config.configuration_init import build_desired_config
@@ -21,9 +23,10 @@ from magma.enodebd.state_machines.acs_state_utils import \
     get_all_objects_to_add, parse_get_parameter_values_response, \
     get_object_params_to_get, get_all_param_values_to_set, \
     get_param_values_to_set, get_obj_param_values_to_set, \
-    get_params_to_get, get_optional_param_to_check
+    get_params_to_get, get_all_optional_params_to_check, \
+    has_params_to_get, has_object_params_to_get, has_objects_to_delete, \
+    has_objects_to_add
 from magma.enodebd.state_machines.enb_acs import EnodebAcsStateMachine
-from magma.enodebd.state_machines.timer import StateMachineTimer
 from magma.enodebd.tr069 import models
 
 AcsMsgAndTransition = namedtuple(
@@ -35,6 +38,29 @@ AcsReadMsgResult = namedtuple(
 )
 
 
+# Messages produced by the state machine are copied into a new message before
+# being sent to the eNB, so constant replies can be shared. They are built on
+# first use, as building a spyne model has side effects on its class.
+@lru_cache(maxsize=1)
+def _get_inform_response() -> models.InformResponse:
+    response = models.InformResponse()
+    # Set maxEnvelopes to 1, as per TR-069 spec
+    response.MaxEnvelopes = 1
+    return response
+
+
+@lru_cache(maxsize=1)
+def _get_dummy_input() -> models.DummyInput:
+    return models.DummyInput()
+
+
+# Parameter values and object parameter values which differed between the
+# desired and device configuration when the last SetParameterValues request
+# of an ACS was built, so they don't need to be computed again once the eNB
+# accepts the request
+_pending_param_values = WeakKeyDictionary()
+
+
 class EnodebAcsState(ABC):
     """
     State class for the Enodeb state machine
@@ -45,9 +71,16 @@ class EnodebAcsState(ABC):
     for reading incoming messages.
 
     In the constructor, set up state transitions.
+
+    EXPECTED_MSG_TYPES lists the message types read_msg() can handle. The
+    state machine skips calling read_msg() for any other message type.
     """
+    __slots__ = ('acs',)
+
+    EXPECTED_MSG_TYPES = (object,)
+
     def __init__(self):
-        self._acs = None
+        self.acs = None
 
     def enter(self) -> None:
         """
@@ -74,14 +107,6 @@ class EnodebAcsState(ABC):
             '%s should implement get_msg() if it '
             'needs to produce messages' % self.__class__.__name__)
 
-    @property
-    def acs(self) -> EnodebAcsStateMachine:
-        return self._acs
-
-    @acs.setter
-    def acs(self, val: EnodebAcsStateMachine) -> None:
-        self._acs = val
-
     @classmethod
     @abstractmethod
     def state_description(cls) -> str:
@@ -89,11 +114,15 @@ class EnodebAcsState(ABC):
         pass
 
 
-class DisconnectedState(EnodebAcsState):
+class _InformHandlerState(EnodebAcsState):
     """
-    This state indicates that no Inform message has been received yet, or
-    that no Inform message has been received for a long time.
+    Shared implementation for states that process an Inform message and
+    reply with an InformResponse
     """
+    __slots__ = ('done_transition',)
+
+    EXPECTED_MSG_TYPES = (models.Inform,)
+
     def __init__(self, acs: EnodebAcsStateMachine, when_done: str):
         super().__init__()
         self.acs = acs
@@ -112,50 +141,35 @@ class DisconnectedState(EnodebAcsState):
 
     def get_msg(self) -> AcsMsgAndTransition:
         """ Reply with InformResponse """
-        response = models.InformResponse()
-        # Set maxEnvelopes to 1, as per TR-069 spec
-        response.MaxEnvelopes = 1
-        return AcsMsgAndTransition(response, self.done_transition)
+        return AcsMsgAndTransition(_get_inform_response(),
+                                   self.done_transition)
+
+
+class DisconnectedState(_InformHandlerState):
+    """
+    This state indicates that no Inform message has been received yet, or
+    that no Inform message has been received for a long time.
+    """
+    __slots__ = ()
 
     @classmethod
     def state_description(cls) -> str:
         return 'Disconnected'
 
 
-class UnexpectedInformState(EnodebAcsState):
+class UnexpectedInformState(_InformHandlerState):
     """
     This state indicates that no Inform message has been received yet, or
     that no Inform message has been received for a long time.
     """
-    def __init__(self, acs: EnodebAcsStateMachine, when_done: str):
-        super().__init__()
-        self.acs = acs
-        self.done_transition = when_done
-
-    def read_msg(self, message: Any) -> AcsReadMsgResult:
-        """
-        Args:
-            message: models.Inform Tr069 Inform message
-        """
-        if not isinstance(message, models.Inform):
-            return AcsReadMsgResult(False, None)
-        process_inform_message(message, self.acs.device_name,
-                               self.acs.data_model, self.acs.device_cfg)
-        return AcsReadMsgResult(True, None)
-
-    def get_msg(self) -> AcsMsgAndTransition:
-        """ Reply with InformResponse """
-        response = models.InformResponse()
-        # Set maxEnvelopes to 1, as per TR-069 spec
-        response.MaxEnvelopes = 1
-        return AcsMsgAndTransition(response, self.done_transition)
+    __slots__ = ()
 
     @classmethod
     def state_description(cls) -> str:
         return 'Awaiting Inform during provisioning'
 
 
-class BaicellsDisconnectedState(EnodebAcsState):
+class BaicellsDisconnectedState(_InformHandlerState):
     """
     This state is to handle a Baicells eNodeB issue.
 
@@ -163,31 +177,7 @@ class BaicellsDisconnectedState(EnodebAcsState):
     time for REM to run. This is a BaiCells eNodeB issue that doesn't support
     enabling the eNodeB during initial REM.
     """
-    def __init__(self, acs: EnodebAcsStateMachine, when_done: str):
-        super().__init__()
-        self.acs = acs
-        self.done_transition = when_done
-
-    def read_msg(self, message: Any) -> AcsReadMsgResult:
-        """
-        Args:
-            message: models.Inform Tr069 Inform message
-        Returns:
-            InformResponse
-        """
-        if not isinstance(message, models.Inform):
-            return AcsReadMsgResult(False, None)
-        process_inform_message(message, self.acs.device_name,
-                               self.acs.data_model, self.acs.device_cfg)
-
-        return AcsReadMsgResult(True, None)
-
-    def get_msg(self) -> AcsMsgAndTransition:
-        """ Returns InformResponse """
-        response = models.InformResponse()
-        # Set maxEnvelopes to 1, as per TR-069 spec
-        response.MaxEnvelopes = 1
-        return AcsMsgAndTransition(response, self.done_transition)
+    __slots__ = ()
 
     @classmethod
     def state_description(cls) -> str:
@@ -203,6 +193,7 @@ class BaicellsRemWaitState(EnodebAcsState):
     time for REM to run. This is a BaiCells eNodeB issue that doesn't support
     enabling the eNodeB during initial REM.
     """
+    __slots__ = ('done_transition', 'timer_handle')
 
     CONFIG_DELAY_AFTER_BOOT = 600
 
@@ -210,25 +201,22 @@ class BaicellsRemWaitState(EnodebAcsState):
         super().__init__()
         self.acs = acs
         self.done_transition = when_done
-        self.rem_timer = None
         self.timer_handle = None
 
     def enter(self):
-        self.rem_timer = StateMachineTimer(self.CONFIG_DELAY_AFTER_BOOT)
-        def check_timer() -> None:
-            if self.rem_timer.is_done():
-                self.acs.transition(self.done_transition)
-
-        self.timer_handle =\
-            self.acs.event_loop.call_later(self.CONFIG_DELAY_AFTER_BOOT,
-                                           check_timer)
+        event_loop = self.acs.event_loop
+        deadline = event_loop.time() + self.CONFIG_DELAY_AFTER_BOOT
+        self.timer_handle = event_loop.call_at(deadline, self._check_timer)
 
     def exit(self):
         self.timer_handle.cancel()
-        self.rem_timer = None
+
+    def _check_timer(self) -> None:
+        # The handle only fires once the full delay has elapsed
+        self.acs.transition(self.done_transition)
 
     def get_msg(self) -> AcsMsgAndTransition:
-        return AcsMsgAndTransition(models.DummyInput(), None)
+        return AcsMsgAndTransition(_get_dummy_input(), None)
 
     def read_msg(self, message: Any) -> AcsReadMsgResult:
         return AcsReadMsgResult(True, None)
@@ -239,6 +227,10 @@ class BaicellsRemWaitState(EnodebAcsState):
 
 
 class WaitEmptyMessageState(EnodebAcsState):
+    __slots__ = ('done_transition',)
+
+    EXPECTED_MSG_TYPES = (models.DummyInput,)
+
     def __init__(self, acs: EnodebAcsStateMachine, when_done: str):
         super().__init__()
         self.acs = acs
@@ -261,6 +253,12 @@ class WaitEmptyMessageState(EnodebAcsState):
 
 
 class CheckOptionalParamsState(EnodebAcsState):
+    __slots__ = (
+        'done_transition', 'optional_param', '_params_to_check', '_handlers',
+    )
+
+    EXPECTED_MSG_TYPES = (models.GetParameterValuesResponse, models.Fault)
+
     def __init__(
             self,
             acs: EnodebAcsStateMachine,
@@ -270,44 +268,66 @@ class CheckOptionalParamsState(EnodebAcsState):
         self.acs = acs
         self.done_transition = when_done
         self.optional_param = None
+        self._params_to_check = deque()
+        self._handlers = {
+            models.Fault: self._handle_fault,
+            models.GetParameterValuesResponse: self._handle_response,
+        }
+
+    def enter(self):
+        self._params_to_check = deque(
+            get_all_optional_params_to_check(self.acs.data_model))
 
     def get_msg(self) -> AcsMsgAndTransition:
-        self.optional_param = get_optional_param_to_check(self.acs.data_model)
-        if self.optional_param is None:
+        if not self._params_to_check:
             raise Tr069Error('Invalid State')
+        self.optional_param = self._params_to_check.popleft()
         # Generate the request
         request = models.GetParameterValues()
         request.ParameterNames = models.ParameterNames()
         request.ParameterNames.arrayType = 'xsd:string[1]'
-        request.ParameterNames.string = []
-        path = self.acs.data_model.get_parameter(self.optional_param).path
-        request.ParameterNames.string.append(path)
+        path = self.acs.data_model.get_path_by_name()[self.optional_param]
+        request.ParameterNames.string = [path]
         return AcsMsgAndTransition(request, None)
 
     def read_msg(self, message: Any) -> AcsReadMsgResult:
         """ Process either GetParameterValuesResponse or a Fault """
-        if type(message) == models.Fault:
-            self.acs.data_model.set_parameter_presence(self.optional_param,
-                                                       False)
-        elif type(message) == models.GetParameterValuesResponse:
-            name_to_val = parse_get_parameter_values_response(
-                self.acs.data_model,
-                message,
-            )
-            logging.debug('Received CPE parameter values: %s',
-                          str(name_to_val))
-            for name, val in name_to_val.items():
-                self.acs.data_model.set_parameter_presence(self.optional_param,
-                                                           True)
-                magma_val = self.acs.data_model.transform_for_magma(name, val)
-                self.acs.device_cfg.set_parameter(name, magma_val)
-        else:
+        handler = self._handlers.get(type(message))
+        if handler is None:
             return AcsReadMsgResult(False, None)
+        handler(message)
 
-        if get_optional_param_to_check(self.acs.data_model) is not None:
+        try:
+            self.acs.data_model.is_parameter_present(self.optional_param)
+        except KeyError:
+            # Presence is still unknown, so check this parameter again
+            self._params_to_check.appendleft(self.optional_param)
+
+        if self._params_to_check:
             return AcsReadMsgResult(True, None)
         return AcsReadMsgResult(True, self.done_transition)
 
+    def _handle_fault(self, _message: models.Fault) -> None:
+        self.acs.data_model.set_parameter_presence(self.optional_param, False)
+
+    def _handle_response(
+        self,
+        message: models.GetParameterValuesResponse,
+    ) -> None:
+        name_to_val = parse_get_parameter_values_response(
+            self.acs.data_model,
+            message,
+        )
+        logging.debug('Received CPE parameter values: %s', name_to_val)
+        if name_to_val:
+            self.acs.data_model.set_parameter_presence(self.optional_param,
+                                                       True)
+        transform_for_magma = self.acs.data_model.transform_for_magma
+        self.acs.device_cfg.set_parameters({
+            name: transform_for_magma(name, val)
+            for name, val in name_to_val.items()
+        })
+
     @classmethod
     def state_description(cls) -> str:
         return 'Checking if some optional parameters exist in data model'
@@ -319,6 +339,10 @@ class SendGetTransientParametersState(EnodebAcsState):
     backing up large numbers of read operations if enodebd is busy.
     Some eNB parameters are read only and updated by the eNB itself.
     """
+    __slots__ = ('done_transition', '_request')
+
+    EXPECTED_MSG_TYPES = (models.DummyInput,)
+
     PARAMETERS = [
         ParameterName.OP_STATE,
         ParameterName.RF_TX_STATUS,
@@ -333,6 +357,7 @@ class SendGetTransientParametersState(EnodebAcsState):
         super().__init__()
         self.acs = acs
         self.done_transition = when_done
+        self._request = None
 
     def read_msg(self, message: Any) -> AcsReadMsgResult:
         if not isinstance(message, models.DummyInput):
@@ -340,18 +365,30 @@ class SendGetTransientParametersState(EnodebAcsState):
         return AcsReadMsgResult(True, None)
 
     def get_msg(self) -> AcsMsgAndTransition:
-        request = models.GetParameterValues()
-        request.ParameterNames = models.ParameterNames()
-        request.ParameterNames.arrayType = \
-            'xsd:string[%d]' % len(self.PARAMETERS)
-        request.ParameterNames.string = []
-        for name in self.PARAMETERS:
-            # Not all data models have these parameters
-            if self.acs.data_model.is_parameter_present(name):
-                path = self.acs.data_model.get_parameter(name).path
-                request.ParameterNames.string.append(path)
+        # Outgoing messages are copied before being sent, so the request only
+        # needs to be built once
+        if self._request is None:
+            paths = self._get_paths()
+            request = models.GetParameterValues()
+            request.ParameterNames = models.ParameterNames()
+            request.ParameterNames.arrayType = 'xsd:string[%d]' % len(paths)
+            request.ParameterNames.string = list(paths)
+            self._request = request
+
+        return AcsMsgAndTransition(self._request, self.done_transition)
+
+    def _get_paths(self) -> Tuple[str, ...]:
+        """
+        Paths of the transient parameters present in the data model.
 
-        return AcsMsgAndTransition(request, self.done_transition)
+        Parameter presence does not change once it is known, and the data
+        model of the ACS is fixed, so this only needs to be computed once.
+        """
+        data_model = self.acs.data_model
+        path_by_name = data_model.get_path_by_name()
+        # Not all data models have these parameters
+        return tuple(path_by_name[name] for name in self.PARAMETERS
+                     if data_model.is_parameter_present(name))
 
     @classmethod
     def state_description(cls) -> str:
@@ -363,6 +400,13 @@ class WaitGetTransientParametersState(EnodebAcsState):
     Periodically read eNodeB status. Note: keep frequency low to avoid
     backing up large numbers of read operations if enodebd is busy
     """
+    __slots__ = (
+        'done_transition', 'get_obj_params_transition', 'rm_obj_transition',
+        'add_obj_transition', 'set_transition', 'skip_transition',
+    )
+
+    EXPECTED_MSG_TYPES = (models.GetParameterValuesResponse,)
+
     def __init__(
             self,
             acs: EnodebAcsStateMachine,
@@ -388,7 +432,7 @@ class WaitGetTransientParametersState(EnodebAcsState):
         # Current values of the fetched parameters
         name_to_val = parse_get_parameter_values_response(self.acs.data_model,
                                                           message)
-        logging.debug('Fetched Transient Params: %s', str(name_to_val))
+        logging.debug('Fetched Transient Params: %s', name_to_val)
 
         # Clear stats when eNodeB stops radiating. This is
         # because eNodeB stops sending performance metrics at this point.
@@ -401,11 +445,11 @@ class WaitGetTransientParametersState(EnodebAcsState):
             self.acs.stats_manager.clear_stats()
 
         # Update device configuration
-        for name in name_to_val:
-            magma_val = \
-                self.acs.data_model.transform_for_magma(name,
-                                                        name_to_val[name])
-            self.acs.device_cfg.set_parameter(name, magma_val)
+        transform_for_magma = self.acs.data_model.transform_for_magma
+        self.acs.device_cfg.set_parameters({
+            name: transform_for_magma(name, val)
+            for name, val in name_to_val.items()
+        })
 
         # Update status metrics
         status = get_enodeb_status(self.acs)
@@ -414,22 +458,15 @@ class WaitGetTransientParametersState(EnodebAcsState):
         return AcsReadMsgResult(True, self.get_next_state())
 
     def get_next_state(self) -> str:
-        should_get_params = \
-            len(get_params_to_get(self.acs.device_cfg,
-                                  self.acs.data_model)) > 0
-        if should_get_params:
+        if has_params_to_get(self.acs.device_cfg, self.acs.data_model):
             return self.done_transition
-        should_get_obj_params = \
-            len(get_object_params_to_get(self.acs.desired_cfg,
-                                         self.acs.device_cfg,
-                                         self.acs.data_model)) > 0
-        if should_get_obj_params:
+        if has_object_params_to_get(self.acs.desired_cfg,
+                                    self.acs.device_cfg,
+                                    self.acs.data_model):
             return self.get_obj_params_transition
-        elif len(get_all_objects_to_delete(self.acs.desired_cfg,
-                                           self.acs.device_cfg)) > 0:
+        elif has_objects_to_delete(self.acs.desired_cfg, self.acs.device_cfg):
             return self.rm_obj_transition
-        elif len(get_all_objects_to_add(self.acs.desired_cfg,
-                                        self.acs.device_cfg)) > 0:
+        elif has_objects_to_add(self.acs.desired_cfg, self.acs.device_cfg):
             return self.add_obj_transition
         return self.skip_transition
 
@@ -443,6 +480,10 @@ class GetParametersState(EnodebAcsState):
     Get the value of most parameters of the eNB that are defined in the data
     model. Object parameters are excluded.
     """
+    __slots__ = ('done_transition',)
+
+    EXPECTED_MSG_TYPES = (models.DummyInput,)
+
     def __init__(self, acs: EnodebAcsStateMachine, when_done: str):
         super().__init__()
         self.acs = acs
@@ -476,10 +517,8 @@ class GetParametersState(EnodebAcsState):
         request.ParameterNames = models.ParameterNames()
         request.ParameterNames.arrayType = 'xsd:string[%d]' \
                                            % len(names)
-        request.ParameterNames.string = []
-        for name in names:
-            path = self.acs.data_model.get_parameter(name).path
-            request.ParameterNames.string.append(path)
+        path_by_name = self.acs.data_model.get_path_by_name()
+        request.ParameterNames.string = [path_by_name[name] for name in names]
 
         return AcsMsgAndTransition(request, self.done_transition)
 
@@ -489,6 +528,10 @@ class GetParametersState(EnodebAcsState):
 
 
 class WaitGetParametersState(EnodebAcsState):
+    __slots__ = ('done_transition',)
+
+    EXPECTED_MSG_TYPES = (models.GetParameterValuesResponse,)
+
     def __init__(self, acs: EnodebAcsStateMachine, when_done: str):
         super().__init__()
         self.acs = acs
@@ -500,10 +543,12 @@ class WaitGetParametersState(EnodebAcsState):
             return AcsReadMsgResult(False, None)
         name_to_val = parse_get_parameter_values_response(self.acs.data_model,
                                                           message)
-        logging.debug('Received CPE parameter values: %s', str(name_to_val))
-        for name, val in name_to_val.items():
-            magma_val = self.acs.data_model.transform_for_magma(name, val)
-            self.acs.device_cfg.set_parameter(name, magma_val)
+        logging.debug('Received CPE parameter values: %s', name_to_val)
+        transform_for_magma = self.acs.data_model.transform_for_magma
+        self.acs.device_cfg.set_parameters({
+            name: transform_for_magma(name, val)
+            for name, val in name_to_val.items()
+        })
         return AcsReadMsgResult(True, self.done_transition)
 
     @classmethod
@@ -512,6 +557,8 @@ class WaitGetParametersState(EnodebAcsState):
 
 
 class GetObjectParametersState(EnodebAcsState):
+    __slots__ = ('done_transition',)
+
     def __init__(self, acs: EnodebAcsStateMachine, when_done: str):
         super().__init__()
         self.acs = acs
@@ -528,10 +575,8 @@ class GetObjectParametersState(EnodebAcsState):
         request.ParameterNames = models.ParameterNames()
         request.ParameterNames.arrayType = 'xsd:string[%d]' \
                                            % len(names)
-        request.ParameterNames.string = []
-        for name in names:
-            path = self.acs.data_model.get_parameter(name).path
-            request.ParameterNames.string.append(path)
+        path_by_name = self.acs.data_model.get_path_by_name()
+        request.ParameterNames.string = [path_by_name[name] for name in names]
 
         return AcsMsgAndTransition(request, self.done_transition)
 
@@ -541,6 +586,13 @@ class GetObjectParametersState(EnodebAcsState):
 
 
 class WaitGetObjectParametersState(EnodebAcsState):
+    __slots__ = (
+        'rm_obj_transition', 'add_obj_transition', 'set_params_transition',
+        'skip_transition',
+    )
+
+    EXPECTED_MSG_TYPES = (models.GetParameterValuesResponse,)
+
     def __init__(
         self,
         acs: EnodebAcsStateMachine,
@@ -561,27 +613,25 @@ class WaitGetObjectParametersState(EnodebAcsState):
         if not isinstance(message, models.GetParameterValuesResponse):
             return AcsReadMsgResult(False, None)
 
-        path_to_val = {}
-        for param_value_struct in message.ParameterList.ParameterValueStruct:
-            path_to_val[param_value_struct.Name] = \
-                param_value_struct.Value.Data
-        logging.debug('Received object parameters: %s', str(path_to_val))
+        path_to_val = {
+            param_value.Name: param_value.Value.Data
+            for param_value in message.ParameterList.ParameterValueStruct
+        }
+        logging.debug('Received object parameters: %s', path_to_val)
 
         # TODO: This might a string for some strange reason, investigate why
         # Get the names of parameters belonging to numbered objects
         num_plmns = \
             int(self.acs.device_cfg.get_parameter(ParameterName.NUM_PLMNS))
-        for i in range(1, num_plmns + 1):
-            obj_name = ParameterName.PLMN_N % i
-            obj_to_params = self.acs.data_model.get_numbered_param_names()
-            param_name_list = obj_to_params[obj_name]
-            for name in param_name_list:
-                path = self.acs.data_model.get_parameter(name).path
+        plmn_param_paths = self.acs.data_model.get_plmn_param_paths()
+        for obj_name, name_and_paths in plmn_param_paths[:num_plmns]:
+            name_to_val = {}
+            for name, path in name_and_paths:
                 value = path_to_val[path]
-                magma_val = \
+                name_to_val[name] = \
                     self.acs.data_model.transform_for_magma(name, value)
-                self.acs.device_cfg.set_parameter_for_object(name, magma_val,
-                                                             obj_name)
+            self.acs.device_cfg.set_parameters_for_object(obj_name,
+                                                          name_to_val)
 
         # Now we can have the desired state
         if self.acs.desired_cfg is None:
@@ -611,6 +661,13 @@ class WaitGetObjectParametersState(EnodebAcsState):
 
 
 class DeleteObjectsState(EnodebAcsState):
+    __slots__ = (
+        'deleted_param', 'add_obj_transition', 'skip_transition',
+        '_pending_deletes', '_handlers',
+    )
+
+    EXPECTED_MSG_TYPES = (models.DeleteObjectResponse, models.Fault)
+
     def __init__(
         self,
         acs: EnodebAcsStateMachine,
@@ -622,6 +679,15 @@ class DeleteObjectsState(EnodebAcsState):
         self.deleted_param = None
         self.add_obj_transition = when_add
         self.skip_transition = when_skip
+        self._pending_deletes = deque()
+        self._handlers = {
+            models.DeleteObjectResponse: self._handle_response,
+            models.Fault: self._handle_fault,
+        }
+
+    def enter(self):
+        self._pending_deletes = deque(get_all_objects_to_delete(
+            self.acs.desired_cfg, self.acs.device_cfg))
 
     def get_msg(self) -> AcsMsgAndTransition:
         """
@@ -630,10 +696,9 @@ class DeleteObjectsState(EnodebAcsState):
             - Object name (string)
         """
         request = models.DeleteObject()
-        self.deleted_param = get_all_objects_to_delete(self.acs.desired_cfg,
-                                                       self.acs.device_cfg)[0]
+        self.deleted_param = self._pending_deletes.popleft()
         request.ObjectName = \
-            self.acs.data_model.get_parameter(self.deleted_param).path
+            self.acs.data_model.get_path_by_name()[self.deleted_param]
         return AcsMsgAndTransition(request, None)
 
     def read_msg(self, message: Any) -> AcsReadMsgResult:
@@ -642,23 +707,27 @@ class DeleteObjectsState(EnodebAcsState):
         Input:
             - Object name (string)
         """
-        if type(message) == models.DeleteObjectResponse:
-            if message.Status != 0:
-                raise Tr069Error('Received DeleteObjectResponse with '
-                                 'Status=%d' % message.Status)
-        elif type(message) == models.Fault:
-            raise Tr069Error('Received Fault in response to DeleteObject '
-                             '(faultstring = %s)' % message.FaultString)
-        else:
+        handler = self._handlers.get(type(message))
+        if handler is None:
             return AcsReadMsgResult(False, None)
+        return handler(message)
+
+    def _handle_fault(self, message: models.Fault) -> AcsReadMsgResult:
+        raise Tr069Error('Received Fault in response to DeleteObject '
+                         '(faultstring = %s)' % message.FaultString)
 
+    def _handle_response(
+        self,
+        message: models.DeleteObjectResponse,
+    ) -> AcsReadMsgResult:
+        if message.Status != 0:
+            raise Tr069Error('Received DeleteObjectResponse with '
+                             'Status=%d' % message.Status)
         self.acs.device_cfg.delete_object(self.deleted_param)
-        obj_list_to_delete = get_all_objects_to_delete(self.acs.desired_cfg,
-                                                       self.acs.device_cfg)
-        if len(obj_list_to_delete) > 0:
+        if self._pending_deletes:
             return AcsReadMsgResult(True, None)
-        if len(get_all_objects_to_add(self.acs.desired_cfg,
-                                      self.acs.device_cfg)) is 0:
+        if not get_all_objects_to_add(self.acs.desired_cfg,
+                                      self.acs.device_cfg):
             return AcsReadMsgResult(True, self.skip_transition)
         return AcsReadMsgResult(True, self.add_obj_transition)
 
@@ -668,35 +737,59 @@ class DeleteObjectsState(EnodebAcsState):
 
 
 class AddObjectsState(EnodebAcsState):
+    __slots__ = (
+        'done_transition', 'added_param', '_pending_adds', '_handlers',
+    )
+
+    EXPECTED_MSG_TYPES = (models.AddObjectResponse, models.Fault)
+
     def __init__(self, acs: EnodebAcsStateMachine, when_done: str):
         super().__init__()
         self.acs = acs
         self.done_transition = when_done
         self.added_param = None
+        self._pending_adds = deque()
+        self._handlers = {
+            models.AddObjectResponse: self._handle_response,
+            models.Fault: self._handle_fault,
+        }
+
+    def enter(self):
+        self._pending_adds = deque(get_all_objects_to_add(
+            self.acs.desired_cfg, self.acs.device_cfg))
 
     def get_msg(self) -> AcsMsgAndTransition:
         request = models.AddObject()
-        self.added_param = get_all_objects_to_add(self.acs.desired_cfg,
-                                                  self.acs.device_cfg)[0]
+        self.added_param = self._pending_adds.popleft()
         request.ObjectName = \
-            self.acs.data_model.get_parameter(self.added_param).path
+            self.acs.data_model.get_path_by_name()[self.added_param]
         return AcsMsgAndTransition(request, None)
 
     def read_msg(self, message: Any) -> AcsReadMsgResult:
-        if type(message) == models.AddObjectResponse:
-            if message.Status != 0:
-                raise Tr069Error('Received AddObjectResponse with '
-                                 'Status=%d' % message.Status)
-        elif type(message) == models.Fault:
-            raise Tr069Error('Received Fault in response to AddObject '
-                             '(faultstring = %s)' % message.FaultString)
-        else:
+        handler = self._handlers.get(type(message))
+        if handler is None:
             return AcsReadMsgResult(False, None)
+        return handler(message)
+
+    def _handle_fault(self, message: models.Fault) -> AcsReadMsgResult:
+        raise Tr069Error('Received Fault in response to AddObject '
+                         '(faultstring = %s)' % message.FaultString)
+
+    def _handle_response(
+        self,
+        message: models.AddObjectResponse,
+    ) -> AcsReadMsgResult:
+        if message.Status != 0:
+            raise Tr069Error('Received AddObjectResponse with '
+                             'Status=%d' % message.Status)
         instance_n = message.InstanceNumber
         self.acs.device_cfg.add_object(self.added_param % instance_n)
-        obj_list_to_add = get_all_objects_to_add(self.acs.desired_cfg,
-                                                 self.acs.device_cfg)
-        if len(obj_list_to_add) > 0:
+        if not self._pending_adds:
+            # The eNB picks the instance number of each object it adds, so
+            # check once more whether that left any desired object missing
+            self._pending_adds = deque(get_all_objects_to_add(
+                self.acs.desired_cfg, self.acs.device_cfg))
+        if self._pending_adds:
             return AcsReadMsgResult(True, None)
         return AcsReadMsgResult(True, self.done_transition)
 
@@ -705,44 +798,75 @@ class AddObjectsState(EnodebAcsState):
         return 'Adding objects'
 
 
+def _get_param_values_to_send(
+    acs: EnodebAcsStateMachine,
+    exclude_admin: bool = False,
+) -> Dict[ParameterName, Any]:
+    """
+    Returns a map of param names to values to send in a SetParameterValues
+    request. The diff it is computed from is kept for the ACS, so it doesn't
+    need to be computed again once the eNB accepts the request.
+    """
+    param_values = get_param_values_to_set(acs.desired_cfg, acs.device_cfg,
+                                           acs.data_model)
+    obj_param_values = get_obj_param_values_to_set(acs.desired_cfg,
+                                                   acs.device_cfg,
+                                                   acs.data_model)
+    _pending_param_values[acs] = (param_values, obj_param_values)
+
+    values_to_send = dict(param_values)
+    if exclude_admin:
+        values_to_send.pop(ParameterName.ADMIN_STATE, None)
+    for _obj_name, param_map in obj_param_values.items():
+        values_to_send.update(param_map)
+    return values_to_send
+
+
+def _build_set_parameter_values(
+    acs: EnodebAcsStateMachine,
+    param_values: Dict[ParameterName, Any],
+) -> models.SetParameterValues:
+    """
+    Returns a SetParameterValues request setting the given param values,
+    encoded the way the eNB expects them
+    """
+    request = models.SetParameterValues()
+    request.ParameterList = models.ParameterValueList()
+    request.ParameterList.arrayType = 'cwmp:ParameterValueStruct[%d]' \
+                                      % len(param_values)
+    logging.debug('Sending TR069 request to set CPE parameter values: %s',
+                  param_values)
+    encoders = acs.data_model.get_encoders()
+    ParameterValueStruct = models.ParameterValueStruct
+    anySimpleType = models.anySimpleType
+    name_values = []
+    append_name_value = name_values.append
+    for name, value in param_values.items():
+        if name not in encoders:
+            raise Tr069Error('Unsupported type for %s: %s' %
+                             (name, acs.data_model.get_parameter(name).type))
+        path, xsd_type, encode, to_enb = encoders[name]
+        name_value = ParameterValueStruct()
+        name_value.Value = anySimpleType()
+        name_value.Name = path
+        name_value.Value.type = xsd_type
+        name_value.Value.Data = encode(to_enb(value))
+        append_name_value(name_value)
+    request.ParameterList.ParameterValueStruct = name_values
+    return request
+
+
 class SetParameterValuesState(EnodebAcsState):
+    __slots__ = ('done_transition',)
+
     def __init__(self, acs: EnodebAcsStateMachine, when_done: str):
         super().__init__()
         self.acs = acs
         self.done_transition = when_done
 
     def get_msg(self) -> AcsMsgAndTransition:
-        request = models.SetParameterValues()
-        request.ParameterList = models.ParameterValueList()
-        param_values = get_all_param_values_to_set(self.acs.desired_cfg,
-                                                   self.acs.device_cfg,
-                                                   self.acs.data_model)
-        request.ParameterList.arrayType = 'cwmp:ParameterValueStruct[%d]' \
-                                          % len(param_values)
-        request.ParameterList.ParameterValueStruct = []
-        logging.debug('Sending TR069 request to set CPE parameter values: %s',
-                      str(param_values))
-        for name, value in param_values.items():
-            type_ = self.acs.data_model.get_parameter(name).type
-            name_value = models.ParameterValueStruct()
-            name_value.Value = models.anySimpleType()
-            name_value.Name = self.acs.data_model.get_parameter(name).path
-            enb_value = self.acs.data_model.transform_for_enb(name, value)
-            if type_ in ('int', 'unsignedInt'):
-                name_value.Value.type = 'xsd:%s' % type_
-                name_value.Value.Data = str(enb_value)
-            elif type_ == 'boolean':
-                # Boolean values have integral representations in spec
-                name_value.Value.type = 'xsd:boolean'
-                name_value.Value.Data = str(int(enb_value))
-            elif type_ == 'string':
-                name_value.Value.type = 'xsd:string'
-                name_value.Value.Data = str(enb_value)
-            else:
-                raise Tr069Error('Unsupported type for %s: %s' %
-                                 (name, type_))
-            request.ParameterList.ParameterValueStruct.append(name_value)
-
+        param_values = _get_param_values_to_send(self.acs)
+        request = _build_set_parameter_values(self.acs, param_values)
         return AcsMsgAndTransition(request, self.done_transition)
 
     @classmethod
@@ -751,44 +875,17 @@ class SetParameterValuesState(EnodebAcsState):
 
 
 class SetParameterValuesNotAdminState(EnodebAcsState):
+    __slots__ = ('done_transition',)
+
     def __init__(self, acs: EnodebAcsStateMachine, when_done: str):
         super().__init__()
         self.acs = acs
         self.done_transition = when_done
 
     def get_msg(self) -> AcsMsgAndTransition:
-        request = models.SetParameterValues()
-        request.ParameterList = models.ParameterValueList()
-        param_values = get_all_param_values_to_set(self.acs.desired_cfg,
-                                                   self.acs.device_cfg,
-                                                   self.acs.data_model,
-                                                   exclude_admin=True)
-        request.ParameterList.arrayType = 'cwmp:ParameterValueStruct[%d]' \
-                                          % len(param_values)
-        request.ParameterList.ParameterValueStruct = []
-        logging.debug('Sending TR069 request to set CPE parameter values: %s',
-                      str(param_values))
-        for name, value in param_values.items():
-            type_ = self.acs.data_model.get_parameter(name).type
-            name_value = models.ParameterValueStruct()
-            name_value.Value = models.anySimpleType()
-            name_value.Name = self.acs.data_model.get_parameter(name).path
-            enb_value = self.acs.data_model.transform_for_enb(name, value)
-            if type_ in ('int', 'unsignedInt'):
-                name_value.Value.type = 'xsd:%s' % type_
-                name_value.Value.Data = str(enb_value)
-            elif type_ == 'boolean':
-                # Boolean values have integral representations in spec
-                name_value.Value.type = 'xsd:boolean'
-                name_value.Value.Data = str(int(enb_value))
-            elif type_ == 'string':
-                name_value.Value.type = 'xsd:string'
-                name_value.Value.Data = str(enb_value)
-            else:
-                raise Tr069Error('Unsupported type for %s: %s' %
-                                 (name, type_))
-            request.ParameterList.ParameterValueStruct.append(name_value)
-
+        param_values = _get_param_values_to_send(self.acs,
+                                                 exclude_admin=True)
+        request = _build_set_parameter_values(self.acs, param_values)
         return AcsMsgAndTransition(request, self.done_transition)
 
     @classmethod
@@ -797,30 +894,45 @@ class SetParameterValuesNotAdminState(EnodebAcsState):
 
 
 class WaitSetParameterValuesState(EnodebAcsState):
+    __slots__ = ('done_transition', '_handlers')
+
+    EXPECTED_MSG_TYPES = (models.SetParameterValuesResponse, models.Fault)
+
     def __init__(self, acs: EnodebAcsStateMachine, when_done: str):
         super().__init__()
         self.acs = acs
         self.done_transition = when_done
+        self._handlers = {
+            models.SetParameterValuesResponse: self._handle_response,
+            models.Fault: self._handle_fault,
+        }
 
     def read_msg(self, message: Any) -> AcsReadMsgResult:
-        if type(message) == models.SetParameterValuesResponse:
-            if message.Status != 0:
-                raise Tr069Error('Received SetParameterValuesResponse with '
-                                 'Status=%d' % message.Status)
-            self._mark_as_configured()
-            return AcsReadMsgResult(True, self.done_transition)
-        elif type(message) == models.Fault:
-            logging.error('Received Fault in response to SetParameterValues')
-            if message.SetParameterValuesFault is not None:
-                for fault in message.SetParameterValuesFault:
-                    logging.error('SetParameterValuesFault Param: %s, '
-                                  'Code: %s, String: %s', fault.ParameterName,
-                                  fault.FaultCode, fault.FaultString)
-            raise Tr069Error(
-                'Received Fault in response to SetParameterValues '
-                '(faultstring = %s)' % message.FaultString)
-        else:
+        handler = self._handlers.get(type(message))
+        if handler is None:
             return AcsReadMsgResult(False, None)
+        return handler(message)
+
+    def _handle_fault(self, message: models.Fault) -> AcsReadMsgResult:
+        logging.error('Received Fault in response to SetParameterValues')
+        if message.SetParameterValuesFault is not None:
+            for fault in message.SetParameterValuesFault:
+                logging.error('SetParameterValuesFault Param: %s, '
+                              'Code: %s, String: %s', fault.ParameterName,
+                              fault.FaultCode, fault.FaultString)
+        raise Tr069Error(
+            'Received Fault in response to SetParameterValues '
+            '(faultstring = %s)' % message.FaultString)
+
+    def _handle_response(
+        self,
+        message: models.SetParameterValuesResponse,
+    ) -> AcsReadMsgResult:
+        if message.Status != 0:
+            raise Tr069Error('Received SetParameterValuesResponse with '
+                             'Status=%d' % message.Status)
+        self._mark_as_configured()
+        return AcsReadMsgResult(True, self.done_transition)
 
     def _mark_as_configured(self) -> None:
         """
@@ -828,26 +940,48 @@ class WaitSetParameterValuesState(EnodebAcsState):
         update what we think the eNB's configuration is to match what we just
         set the parameter values to.
         """
+        pending = _pending_param_values.pop(self.acs, None)
+        if pending is not None:
+            name_to_val, obj_to_name_to_val = pending
+        else:
+            name_to_val = get_param_values_to_set(self.acs.desired_cfg,
+                                                  self.acs.device_cfg,
+                                                  self.acs.data_model)
+            obj_to_name_to_val = get_obj_param_values_to_set(
+                self.acs.desired_cfg, self.acs.device_cfg, self.acs.data_model)
+
+        # Skip updating the device configuration if nothing was set
+        if name_to_val or any(obj_to_name_to_val.values()):
+            self._update_device_cfg(name_to_val, obj_to_name_to_val)
+        logging.info('Successfully configured CPE parameters!')
+
+    def _update_device_cfg(
+        self,
+        name_to_val: Dict[ParameterName, Any],
+        obj_to_name_to_val: Dict[ParameterName, Dict[ParameterName, Any]],
+    ) -> None:
         # Values of parameters
-        name_to_val = get_param_values_to_set(self.acs.desired_cfg,
-                                              self.acs.device_cfg,
-                                              self.acs.data_model)
-        for name, val in name_to_val.items():
-            magma_val = self.acs.data_model.transform_for_magma(name, val)
-            self.acs.device_cfg.set_parameter(name, magma_val)
+        self.acs.device_cfg.set_parameters(self._to_magma(name_to_val))
 
         # Values of object parameters
-        obj_to_name_to_val = get_obj_param_values_to_set(self.acs.desired_cfg,
-                                                         self.acs.device_cfg,
-                                                         self.acs.data_model)
-        for obj_name, name_to_val in obj_to_name_to_val.items():
-            for name, val in name_to_val.items():
-                logging.debug('Set obj: %s, name: %s, val: %s', str(obj_name),
-                              str(name), str(val))
-                magma_val = self.acs.data_model.transform_for_magma(name, val)
-                self.acs.device_cfg.set_parameter_for_object(name, magma_val,
-                                                             obj_name)
-        logging.info('Successfully configured CPE parameters!')
+        is_debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+        for obj_name, obj_name_to_val in obj_to_name_to_val.items():
+            if not obj_name_to_val:
+                continue
+            if is_debug_enabled:
+                for name, val in obj_name_to_val.items():
+                    logging.debug('Set obj: %s, name: %s, val: %s', obj_name,
+                                  name, val)
+            self.acs.device_cfg.set_parameters_for_object(
+                obj_name, self._to_magma(obj_name_to_val))
+
+    def _to_magma(
+        self,
+        name_to_val: Dict[ParameterName, Any],
+    ) -> Dict[ParameterName, Any]:
+        get_magma_transformer = self.acs.data_model.get_magma_transformer
+        return {name: get_magma_transformer(name)(val)
+                for name, val in name_to_val.items()}
 
     @classmethod
     def state_description(cls) -> str:
@@ -855,6 +989,8 @@ class WaitSetParameterValuesState(EnodebAcsState):
 
 
 class SendRebootState(EnodebAcsState):
+    __slots__ = ('done_transition',)
+
     def __init__(self, acs: EnodebAcsStateMachine, when_done: str):
         super().__init__()
         self.acs = acs
@@ -878,24 +1014,38 @@ class SendRebootState(EnodebAcsState):
 
 
 class WaitRebootResponseState(EnodebAcsState):
+    __slots__ = ('done_transition', '_handlers')
+
+    EXPECTED_MSG_TYPES = (models.RebootResponse, models.Fault)
+
     def __init__(self, acs: EnodebAcsStateMachine, when_done: str):
         super().__init__()
         self.acs = acs
         self.done_transition = when_done
+        self._handlers = {
+            models.RebootResponse: self._handle_response,
+            models.Fault: self._handle_fault,
+        }
 
     def read_msg(self, message: Any) -> AcsReadMsgResult:
-        if type(message) == models.RebootResponse:
-            pass
-        elif type(message) == models.Fault:
-            raise Tr069Error('Received Fault in response to Reboot '
-                             '(faultstring = %s)' % message.FaultString)
-        else:
+        handler = self._handlers.get(type(message))
+        if handler is None:
             return AcsReadMsgResult(False, None)
+        return handler(message)
+
+    def _handle_fault(self, message: models.Fault) -> AcsReadMsgResult:
+        raise Tr069Error('Received Fault in response to Reboot '
+                         '(faultstring = %s)' % message.FaultString)
+
+    def _handle_response(
+        self,
+        _message: models.RebootResponse,
+    ) -> AcsReadMsgResult:
         return AcsReadMsgResult(True, self.done_transition)
 
     def get_msg(self) -> AcsMsgAndTransition:
         """ Reply with empty message """
-        return AcsMsgAndTransition(models.DummyInput(), self.done_transition)
+        return AcsMsgAndTransition(_get_dummy_input(), self.done_transition)
 
     @classmethod
     def state_description(cls) -> str:
@@ -907,6 +1057,12 @@ class WaitInformMRebootState(EnodebAcsState):
     After sending a reboot request, we expect an Inform request with a
     specific 'inform event code'
     """
+    __slots__ = (
+        'done_transition', 'timeout_transition', 'timer_handle',
+        'received_inform', '_handlers',
+    )
+
+    EXPECTED_MSG_TYPES = (models.Inform, models.Fault)
 
     # Time to wait for eNodeB reboot. The measured time
     # (on BaiCells indoor eNodeB)
@@ -925,42 +1081,45 @@ class WaitInformMRebootState(EnodebAcsState):
         self.acs = acs
         self.done_transition = when_done
         self.timeout_transition = when_timeout
-        self.timeout_timer = None
         self.timer_handle = None
         self.received_inform = False
+        self._handlers = {
+            models.Inform: self._handle_inform,
+            models.Fault: self._handle_fault,
+        }
 
     def enter(self):
-        self.timeout_timer = StateMachineTimer(self.REBOOT_TIMEOUT)
-
-        def check_timer() -> None:
-            if self.timeout_timer.is_done():
-                self.acs.transition(self.timeout_transition)
-                raise Tr069Error('Did not receive Inform response after '
-                                 'rebooting')
-
-        self.timer_handle = \
-            self.acs.event_loop.call_later(self.REBOOT_TIMEOUT,
-                                           check_timer)
+        event_loop = self.acs.event_loop
+        deadline = event_loop.time() + self.REBOOT_TIMEOUT
+        self.timer_handle = event_loop.call_at(deadline, self._on_timeout)
 
     def exit(self):
         self.timer_handle.cancel()
-        self.timeout_timer = None
+
+    def _on_timeout(self) -> None:
+        # The handle only fires once the full timeout has elapsed
+        self.acs.transition(self.timeout_transition)
+        raise Tr069Error('Did not receive Inform response after rebooting')
 
     def read_msg(self, message: Any) -> AcsReadMsgResult:
-        if type(message) == models.Inform:
-            is_correct_event = False
-            for event in message.Event.EventStruct:
-                logging.debug('Inform event: %s', event.EventCode)
-                if event.EventCode == self.INFORM_EVENT_CODE:
-                    is_correct_event = True
-            if not is_correct_event:
-                raise Tr069Error('Did not receive M Reboot event code in '
-                                 'Inform')
-        elif type(message) == models.Fault:
-            # eNodeB may send faults for no apparent reason before rebooting
-            return AcsReadMsgResult(True, None)
-        else:
+        handler = self._handlers.get(type(message))
+        if handler is None:
             return AcsReadMsgResult(False, None)
+        return handler(message)
+
+    def _handle_fault(self, _message: models.Fault) -> AcsReadMsgResult:
+        # eNodeB may send faults for no apparent reason before rebooting
+        return AcsReadMsgResult(True, None)
+
+    def _handle_inform(self, message: models.Inform) -> AcsReadMsgResult:
+        events = message.Event.EventStruct
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            for event in events:
+                logging.debug('Inform event: %s', event.EventCode)
+        if not any(event.EventCode == self.INFORM_EVENT_CODE
+                   for event in events):
+            raise Tr069Error('Did not receive M Reboot event code in '
+                             'Inform')
 
         self.received_inform = True
         process_inform_message(message, self.acs.device_name,
@@ -970,12 +1129,10 @@ class WaitInformMRebootState(EnodebAcsState):
     def get_msg(self) -> AcsMsgAndTransition:
         """ Reply with InformResponse """
         if self.received_inform:
-            response = models.InformResponse()
-            # Set maxEnvelopes to 1, as per TR-069 spec
-            response.MaxEnvelopes = 1
-            return AcsMsgAndTransition(response, self.done_transition)
+            return AcsMsgAndTransition(_get_inform_response(),
+                                       self.done_transition)
         else:
-            return AcsMsgAndTransition(models.DummyInput(), None)
+            return AcsMsgAndTransition(_get_dummy_input(), None)
 
     @classmethod
     def state_description(cls) -> str:
@@ -988,6 +1145,7 @@ class WaitRebootDelayState(EnodebAcsState):
     rebooted, wait a short duration to prevent unspecified race conditions
     that may occur w.r.t reboot
     """
+    __slots__ = ('done_transition', 'timer_handle')
 
     # Short delay timer to prevent race conditions w.r.t. reboot
     SHORT_CONFIG_DELAY = 10
@@ -996,29 +1154,25 @@ class WaitRebootDelayState(EnodebAcsState):
         super().__init__()
         self.acs = acs
         self.done_transition = when_done
-        self.config_timer = None
         self.timer_handle = None
 
     def enter(self):
-        self.config_timer = StateMachineTimer(self.SHORT_CONFIG_DELAY)
-
-        def check_timer() -> None:
-            if self.config_timer.is_done():
-                self.acs.transition(self.done_transition)
-
-        self.timer_handle = \
-            self.acs.event_loop.call_later(self.SHORT_CONFIG_DELAY,
-                                           check_timer)
+        event_loop = self.acs.event_loop
+        deadline = event_loop.time() + self.SHORT_CONFIG_DELAY
+        self.timer_handle = event_loop.call_at(deadline, self._check_timer)
 
     def exit(self):
         self.timer_handle.cancel()
-        self.config_timer = None
+
+    def _check_timer(self) -> None:
+        # The handle only fires once the full delay has elapsed
+        self.acs.transition(self.done_transition)
 
     def read_msg(self, message: Any) -> AcsReadMsgResult:
         return AcsReadMsgResult(True, None)
 
     def get_msg(self) -> AcsMsgAndTransition:
-        return AcsMsgAndTransition(models.DummyInput(), None)
+        return AcsMsgAndTransition(_get_dummy_input(), None)
 
     @classmethod
     def state_description(cls) -> str:
@@ -1029,6 +1183,7 @@ class ErrorState(EnodebAcsState):
     """
     The eNB handler will enter this state when an unhandled Fault is received
     """
+    __slots__ = ()
 
     def __init__(self, acs: EnodebAcsStateMachine):
         super().__init__()
@@ -1038,7 +1193,7 @@ class ErrorState(EnodebAcsState):
         return AcsReadMsgResult(True, None)
 
     def get_msg(self) -> AcsMsgAndTransition:
-        return AcsMsgAndTransition(models.DummyInput(), None)
+        return AcsMsgAndTransition(_get_dummy_input(), None)
 
     @classmethod
     def state_description(cls) -> str:
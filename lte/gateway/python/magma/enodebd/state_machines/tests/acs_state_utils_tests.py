@@ -0,0 +1,58 @@
+"""
+Copyright (c) 2016-present, Facebook, Inc.
+All rights reserved.
+
+This source code is licensed under the BSD-style license found in the
+LICENSE file in the root directory of this source tree. An additional grant
+of patent rights can be found in the PATENTS file in the same directory.
+"""
+
+from unittest import TestCase
+from magma.enodebd.data_models.data_model_parameters import ParameterName
+from magma.enodebd.device_config.enodeb_configuration import \
+    EnodebConfiguration
+from magma.enodebd.state_machines.acs_state_utils import \
+    get_object_params_to_get, has_object_params_to_get, has_params_to_get
+from magma.enodebd.state_machines.tests.test_utils import \
+    get_data_model_without_optional_params
+
+
+class AcsStateUtilsTests(TestCase):
+    def setUp(self):
+        self.data_model = get_data_model_without_optional_params()
+        self.device_cfg = EnodebConfiguration(self.data_model)
+
+    def test_has_params_to_get(self) -> None:
+        self.assertTrue(has_params_to_get(self.device_cfg, self.data_model),
+                        'No param values are known yet')
+        self.device_cfg.set_parameters({
+            name: None for name in self.data_model.get_present_params()
+        })
+        self.assertFalse(has_params_to_get(self.device_cfg, self.data_model),
+                         'All param values are known')
+
+    def test_has_object_params_to_get(self) -> None:
+        self.device_cfg.set_parameter(ParameterName.NUM_PLMNS, 2)
+        desired_cfg = EnodebConfiguration(self.data_model)
+        self.assertTrue(has_object_params_to_get(None, self.device_cfg,
+                                                 self.data_model),
+                        'No object param values are known yet')
+        self.assertEqual(self.device_cfg.get_object_names(),
+                         [ParameterName.PLMN_N % 1, ParameterName.PLMN_N % 2],
+                         'All missing PLMN objects should have been added')
+
+        obj_to_params = self.data_model.get_numbered_param_names()
+        for i in (1, 2):
+            obj_name = ParameterName.PLMN_N % i
+            desired_cfg.add_object(obj_name)
+            desired_cfg.set_parameters_for_object(obj_name, {
+                name: None for name in obj_to_params[obj_name]
+            })
+        self.assertFalse(has_object_params_to_get(desired_cfg,
+                                                  self.device_cfg,
+                                                  self.data_model),
+                         'All object param values are known')
+        self.assertEqual(get_object_params_to_get(desired_cfg,
+                                                  self.device_cfg,
+                                                  self.data_model),
+                         [], 'Should agree with has_object_params_to_get')
@@ -0,0 +1,59 @@
+"""
+Copyright (c) 2016-present, Facebook, Inc.
+All rights reserved.
+
+This source code is licensed under the BSD-style license found in the
+LICENSE file in the root directory of this source tree. An additional grant
+of patent rights can be found in the PATENTS file in the same directory.
+"""
+
+from unittest import TestCase, mock
+from magma.enodebd.data_models.data_model_parameters import ParameterName
+from magma.enodebd.device_config.enodeb_configuration import \
+    EnodebConfiguration
+from magma.enodebd.state_machines.enb_acs_states import \
+    WaitGetTransientParametersState
+from magma.enodebd.state_machines.tests.test_utils import \
+    get_data_model_without_optional_params
+
+
+class WaitGetTransientParametersStateTests(TestCase):
+    def test_get_next_state(self) -> None:
+        data_model = get_data_model_without_optional_params()
+        device_cfg = EnodebConfiguration(data_model)
+        acs = mock.Mock(data_model=data_model, device_cfg=device_cfg,
+                        desired_cfg=None)
+        state = WaitGetTransientParametersState(
+            acs,
+            when_get='get_params',
+            when_get_obj_params='get_obj_params',
+            when_delete='delete_objs',
+            when_add='add_objs',
+            when_set='set_params',
+            when_skip='skip',
+        )
+        self.assertEqual(state.get_next_state(), 'get_params',
+                         'No param values are known yet')
+
+        device_cfg.set_parameters({
+            name: None for name in data_model.get_present_params()
+        })
+        device_cfg.set_parameter(ParameterName.NUM_PLMNS, 1)
+        self.assertEqual(state.get_next_state(), 'get_obj_params',
+                         'Object param values are not known yet')
+
+        obj_to_params = data_model.get_numbered_param_names()
+        desired_cfg = EnodebConfiguration(data_model)
+        for i in (1, 2):
+            obj_name = ParameterName.PLMN_N % i
+            desired_cfg.add_object(obj_name)
+            desired_cfg.set_parameters_for_object(obj_name, {
+                name: None for name in obj_to_params[obj_name]
+            })
+        acs.desired_cfg = desired_cfg
+        self.assertEqual(state.get_next_state(), 'add_objs',
+                         'Device config is missing an object')
+
+        desired_cfg.delete_object(ParameterName.PLMN_N % 2)
+        self.assertEqual(state.get_next_state(), 'skip',
+                         'Device config matches the desired objects')
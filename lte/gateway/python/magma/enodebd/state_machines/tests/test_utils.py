@@ -0,0 +1,21 @@
+"""
+Copyright (c) 2016-present, Facebook, Inc.
+All rights reserved.
+
+This source code is licensed under the BSD-style license found in the
+LICENSE file in the root directory of this source tree. An additional grant
+of patent rights can be found in the PATENTS file in the same directory.
+"""
+
+from magma.enodebd.devices.baicells import BaicellsTrDataModel
+
+
+def get_data_model_without_optional_params() -> BaicellsTrDataModel:
+    """
+    Returns: A data model for which every optional parameter is known to be
+        absent, so only the parameters that are always present are fetched
+    """
+    data_model = BaicellsTrDataModel()
+    for name in data_model.get_names_of_optional_params():
+        data_model.set_parameter_presence(name, False)
+    return data_model
@@ -7,16 +7,14 @@ LICENSE file in the root directory of this source tree. An additional grant
 of patent rights can be found in the PATENTS file in the same directory.
 """
 
-from datetime import datetime, timedelta
+from time import monotonic
 
 
 class StateMachineTimer():
+    __slots__ = ('deadline',)
+
     def __init__(self, seconds_remaining):
-        self.start_time = datetime.now()
-        self.seconds = seconds_remaining
+        self.deadline = monotonic() + seconds_remaining
 
     def is_done(self):
-        time_elapsed = datetime.now() - self.start_time
-        if time_elapsed > timedelta(seconds=self.seconds):
-            return True
-        return False
+        return monotonic() >= self.deadline
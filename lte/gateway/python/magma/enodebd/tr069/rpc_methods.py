@@ -106,7 +106,7 @@ class AutoConfigServer(ServiceBase):
 
         # Log incoming msg
         if hasattr(message, 'as_dict'):
-            logging.debug('Handling TR069 message: %s', str(type(message)))
+            logging.debug('Handling TR069 message: %s', type(message))
         else:
             logging.debug('Handling TR069 message.')
 
@@ -120,11 +120,13 @@ class AutoConfigServer(ServiceBase):
             # Retry with the new state machine
             req = cls.state_machine().handle_tr069_message(message)
 
-        # Log outgoing msg
-        if hasattr(req, 'as_dict'):
-            logging.debug('Sending TR069 message: %s', str(req.as_dict()))
-        else:
-            logging.debug('Sending TR069 message.')
+        # Log outgoing msg. Converting the message is costly, so only do it
+        # when the record would be emitted
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            if hasattr(req, 'as_dict'):
+                logging.debug('Sending TR069 message: %s', req.as_dict())
+            else:
+                logging.debug('Sending TR069 message.')
 
         # Set header
         ctx.out_header = models.ID(mustUnderstand='1')